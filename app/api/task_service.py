@@ -1,24 +1,161 @@
 """Task service layer for business logic."""
 
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
 from bson import ObjectId
 from bson.errors import InvalidId
-from app.models.task import Task
-from app.database.connection import DatabaseConnection
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.collection import Collection
+from app.models.task import Task, TaskSummary, PRIORITY_RANK, validate_fields
+from app.database.connection import TITLE_COLLATION
+
+# Fields needed to build a Task; anything else stored on the document is not decoded
+TASK_FIELDS = {"title": 1, "description": 1, "due_date": 1, "priority": 1, "status": 1, "created_at": 1}
+
+# Fields of a TaskSummary, for listings that only show IDs/titles (e.g. picking a task to complete)
+SUMMARY_FIELDS = {"title": 1, "status": 1}
+
+# Fields a caller is allowed to change through update_task
+ALLOWED_UPDATE_KEYS = frozenset({"title", "description", "due_date", "priority", "status"})
+
+# Tasks sent per insert_many/bulk_write call in bulk operations
+BULK_BATCH_SIZE = 1000
+
+# Maximum number of distinct query results kept in the read cache
+CACHE_SIZE = 32
+
+# Sort fields exposed to callers mapped to the stored document field
+SORT_FIELDS = {
+    "title": "title",
+    "priority": "priority_rank",
+    "status": "status",
+    "created_at": "created_at",
+    "due_date": "due_date",
+}
 
 
 class TaskService:
     """Service class for task operations."""
     
-    def __init__(self, db_connection: DatabaseConnection):
+    def __init__(self, collection: Collection):
+        """
+        Initialize TaskService with the tasks collection.
+        
+        Args:
+            collection: MongoDB tasks collection
+        """
+        self.collection = collection
+        # Read-through cache of query results, cleared on every write
+        self._cache: "OrderedDict[tuple, List[Task]]" = OrderedDict()
+    
+    def _find_sorted(self, query: dict, sort_field: str = "created_at", sort_order: str = "desc",
+                     projection: Optional[dict] = None):
+        """
+        Build a cursor for the query sorted server-side.
+        
+        Args:
+            query: MongoDB filter document
+            sort_field: One of SORT_FIELDS (defaults to created_at)
+            sort_order: 'asc' or 'desc'
+            projection: Fields to return (defaults to TASK_FIELDS)
+            
+        Returns:
+            Cursor: Sorted cursor over matching documents
+        """
+        direction = 1 if sort_order == "asc" else -1
+        field = SORT_FIELDS.get(sort_field, "created_at")
+        
+        # Ties broken by created_at in the same direction, so one index serves both orders
+        sort_spec = [(field, direction)]
+        if field != "created_at":
+            sort_spec.append(("created_at", direction))
+        
+        cursor = self.collection.find(query, projection=projection or TASK_FIELDS).sort(sort_spec)
+        if field == "title":
+            cursor = cursor.collation(TITLE_COLLATION)
+        return cursor
+    
+    def _find_tasks(self, query: dict, sort_field: str = "created_at", sort_order: str = "desc",
+                    projection: Optional[dict] = None) -> List[Task]:
         """
-        Initialize TaskService with database connection.
+        Get tasks for the query, served from the cache when nothing has changed.
         
         Args:
-            db_connection: Database connection instance
+            query: MongoDB filter document
+            sort_field: One of SORT_FIELDS (defaults to created_at)
+            sort_order: 'asc' or 'desc'
+            projection: Fields to return (defaults to TASK_FIELDS)
+            
+        Returns:
+            List[Task]: List of matching tasks
+        """
+        key = self._find_key("find", query, sort_field, sort_order, projection)
+        tasks = self._cache.get(key)
+        if tasks is None:
+            # The whole result is needed anyway, so build it in one tight loop
+            tasks = Task.bulk_from_cursor(self._find_sorted(query, sort_field, sort_order, projection))
+            self._store(key, tasks)
+        else:
+            self._cache.move_to_end(key)
+        
+        # Copy so callers can't alter the cached result
+        return list(tasks)
+    
+    def _iter_find(self, query: dict, sort_field: str = "created_at", sort_order: str = "desc",
+                   projection: Optional[dict] = None) -> Iterator[Task]:
+        """Stream tasks for a find query, see _find_tasks."""
+        key = self._find_key("stream", query, sort_field, sort_order, projection)
+        return self._iter_cached(key, lambda: self._find_sorted(query, sort_field, sort_order, projection))
+    
+    @staticmethod
+    def _find_key(path: str, query: dict, sort_field: str, sort_order: str,
+                  projection: Optional[dict]) -> tuple:
+        """
+        Cache key for a find query.
+        
+        The path ('find' or 'stream') is part of the key because _find_tasks caches
+        Task lists while streaming caches lazily decoded RawTask views.
         """
-        self.db_connection = db_connection
-        self.collection = db_connection.get_collection()
+        # repr() keeps nested operators such as $in hashable for the key
+        return (path, repr(query), sort_field, sort_order, repr(projection))
+    
+    def _store(self, key: tuple, tasks: List[Task]):
+        """Cache a fully loaded result, evicting the least recently used one if full."""
+        self._cache[key] = tasks
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def _iter_cached(self, key: tuple, load) -> Iterator[Task]:
+        """
+        Yield cached tasks for key, or stream them from the documents load() yields.
+        
+        Tasks are yielded as they arrive from the cursor and the result is only
+        cached once the cursor has been fully consumed.
+        
+        Args:
+            key: Hashable cache key describing the query
+            load: Callable returning an iterable of raw task documents
+            
+        Yields:
+            Task: Matching tasks in query order
+        """
+        tasks = self._cache.get(key)
+        if tasks is not None:
+            self._cache.move_to_end(key)
+            yield from tasks
+            return
+        
+        tasks = []
+        for doc in load():
+            task = Task.from_raw(doc)
+            tasks.append(task)
+            yield task
+        
+        self._store(key, tasks)
+    
+    def _invalidate_cache(self):
+        """Drop cached query results after a write."""
+        self._cache.clear()
     
     def create_task(self, title: str, description: str = "", due_date: Optional[str] = None,
                    priority: str = "Medium") -> Task:
@@ -36,29 +173,82 @@ class TaskService:
         """
         task = Task(title=title, description=description, due_date=due_date, priority=priority)
         
-        # Insert into database
-        result = self.collection.insert_one(task.to_dict())
-        if result:
-            created_task = Task(title=title, description=description, due_date=due_date, priority=priority, task_id=result.inserted_id)
-        else: 
-            return task
+        # Insert into database; to_dict() assigns the id, so the task already matches the stored document
+        self.collection.insert_one(task.to_dict())
+        self._invalidate_cache()
         
-        return created_task
+        return task
     
-    def get_all_tasks(self) -> List[Task]:
+    def insert_tasks(self, tasks: List[Task], batch_size: int = BULK_BATCH_SIZE) -> int:
         """
-        Retrieve all tasks from database.
+        Insert many tasks with unordered insert_many calls instead of one insert per task.
         
+        Args:
+            tasks: Validated Task instances to store
+            batch_size: Tasks sent per insert_many call
+            
         Returns:
-            List[Task]: List of all tasks
+            int: Number of tasks inserted
         """
-        tasks = []
-        cursor = self.collection.find().sort("created_at", -1)  # Latest first
+        if not tasks:
+            return 0
         
-        for doc in cursor:
-            tasks.append(Task.from_dict(doc))
+        inserted = 0
+        try:
+            for start in range(0, len(tasks), batch_size):
+                # Unordered: tasks are independent, so the server may apply them in parallel
+                result = self.collection.insert_many(
+                    [task.to_dict() for task in tasks[start:start + batch_size]],
+                    ordered=False
+                )
+                inserted += len(result.inserted_ids)
+        finally:
+            # A failed batch (e.g. duplicate key) may still have written part of its tasks
+            self._invalidate_cache()
+        return inserted
+    
+    def upsert_tasks(self, tasks: List[Task], batch_size: int = BULK_BATCH_SIZE) -> int:
+        """
+        Insert or replace the fields of many tasks with unordered bulk_write calls.
         
-        return tasks
+        Args:
+            tasks: Validated Task instances to store
+            batch_size: Operations sent per bulk_write call
+            
+        Returns:
+            int: Number of tasks inserted or modified
+        """
+        if not tasks:
+            return 0
+        
+        changed = 0
+        try:
+            for start in range(0, len(tasks), batch_size):
+                operations = []
+                for task in tasks[start:start + batch_size]:
+                    document = task.to_dict()
+                    task_id = document.pop("_id")
+                    operations.append(UpdateOne({"_id": task_id}, {"$set": document}, upsert=True))
+                
+                result = self.collection.bulk_write(operations, ordered=False)
+                changed += result.upserted_count + result.modified_count
+        finally:
+            # A failed batch may still have applied part of its operations
+            self._invalidate_cache()
+        return changed
+    
+    def get_all_tasks(self, sort_field: str = "created_at", sort_order: str = "desc") -> List[Task]:
+        """
+        Retrieve all tasks from database.
+        
+        Args:
+            sort_field: Field to sort by (latest first by default)
+            sort_order: 'asc' or 'desc'
+            
+        Returns:
+            List[Task]: List of all tasks
+        """
+        return self._find_tasks({}, sort_field, sort_order)
     
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """
@@ -75,40 +265,70 @@ class TaskService:
             doc = self.collection.find_one({"_id": object_id})
             
             if doc:
-                return Task.from_dict(doc)
+                return Task._from_trusted(doc)
             return None
             
         except InvalidId:
             return None
-    def mark_task_completed(self, task_id: str) ->bool:
+    
+    def mark_task_completed(self, task_id: str) -> Tuple[bool, Optional[TaskSummary]]:
         """
-        Update a task with new values.
+        Mark a task as completed in a single round-trip.
         
         Args:
             task_id: Task ID string
-            **updates: Fields to update
             
         Returns:
-            bool: True if update successful, False otherwise
+            tuple: (True if the task was changed to Completed, summary of the task as
+                   it was before the update or None if not found)
         """
         try:
             object_id = ObjectId(task_id)
-        
-            # Filter out None values and empty strings (except for description)
-            filtered_updates = {"status": "Completed"}
-  
-            if not filtered_updates:
-                return False
             
-            result = self.collection.update_one(
+            # Returns the pre-update document so the caller can tell "not found"
+            # from "already completed" without a separate lookup
+            doc = self.collection.find_one_and_update(
                 {"_id": object_id},
-                {"$set": filtered_updates}
+                {"$set": {"status": "Completed"}},
+                projection=SUMMARY_FIELDS,
+                return_document=ReturnDocument.BEFORE
             )
+            self._invalidate_cache()
             
-            return result.modified_count > 0
+            if not doc:
+                return False, None
+            return doc.get("status") != "Completed", TaskSummary.from_doc(doc)
             
         except InvalidId:
-            return False
+            return False, None
+    
+    def mark_tasks_completed(self, task_ids: List[str]) -> int:
+        """
+        Mark several tasks as completed with a single update_many.
+        
+        Args:
+            task_ids: Task ID strings (invalid IDs are skipped)
+            
+        Returns:
+            int: Number of tasks changed to Completed
+        """
+        object_ids = []
+        for task_id in task_ids:
+            try:
+                object_ids.append(ObjectId(task_id))
+            except InvalidId:
+                continue
+        
+        if not object_ids:
+            return 0
+        
+        result = self.collection.update_many(
+            {"_id": {"$in": object_ids}, "status": {"$ne": "Completed"}},
+            {"$set": {"status": "Completed"}}
+        )
+        self._invalidate_cache()
+        
+        return result.modified_count
     
     def update_task(self, task_id: str, **updates) -> bool:
         """
@@ -119,24 +339,34 @@ class TaskService:
             **updates: Fields to update
             
         Returns:
-            bool: True if update successful, False otherwise
+            bool: True if update successful, False otherwise (including invalid values)
         """
         try:
             object_id = ObjectId(task_id)
             
-            # Filter out None values and empty strings (except for description)
-            filtered_updates = {}
-            for key, value in updates.items():
-                if value is not None and (value != "" or key == "description"):
-                    filtered_updates[key] = value
+            # Keep known fields only and filter out None values and empty strings (except for description)
+            filtered_updates = {
+                key: value for key, value in updates.items()
+                if key in ALLOWED_UPDATE_KEYS and value is not None and (value != "" or key == "description")
+            }
             
             if not filtered_updates:
                 return False
             
+            # Apply the model's validation so stored documents stay canonical for _from_trusted
+            try:
+                filtered_updates = validate_fields(filtered_updates)
+            except (TypeError, ValueError):
+                return False
+            
+            if "priority" in filtered_updates:
+                filtered_updates["priority_rank"] = PRIORITY_RANK[filtered_updates["priority"]]
+            
             result = self.collection.update_one(
                 {"_id": object_id},
                 {"$set": filtered_updates}
             )
+            self._invalidate_cache()
             
             return result.modified_count > 0
             
@@ -156,43 +386,119 @@ class TaskService:
         try:
             object_id = ObjectId(task_id)
             result = self.collection.delete_one({"_id": object_id})
+            self._invalidate_cache()
             return result.deleted_count > 0
             
         except InvalidId:
             return False
     
-    def get_tasks_by_status(self, status: str) -> List[Task]:
+    def get_tasks_by_status(self, status: str, sort_field: str = "created_at",
+                            sort_order: str = "desc") -> List[Task]:
         """
         Get tasks filtered by status.
         
         Args:
             status: Task status
+            sort_field: Field to sort by (latest first by default)
+            sort_order: 'asc' or 'desc'
             
         Returns:
             List[Task]: List of tasks with specified status
         """
-        tasks = []
-        cursor = self.collection.find({"status": status}).sort("created_at", -1)
-        
-        for doc in cursor:
-            tasks.append(Task.from_dict(doc))
-        
-        return tasks
+        return self._find_tasks({"status": status}, sort_field, sort_order)
     
-    def get_tasks_by_priority(self, priority: str) -> List[Task]:
+    def get_tasks_by_priority(self, priority: str, sort_field: str = "created_at",
+                              sort_order: str = "desc") -> List[Task]:
         """
         Get tasks filtered by priority.
         
         Args:
             priority: Task priority
+            sort_field: Field to sort by (latest first by default)
+            sort_order: 'asc' or 'desc'
             
         Returns:
             List[Task]: List of tasks with specified priority
         """
-        tasks = []
-        cursor = self.collection.find({"priority": priority}).sort("created_at", -1)
+        return self._find_tasks({"priority": priority}, sort_field, sort_order)
+    
+    def get_tasks_by_statuses(self, statuses: List[str]) -> List[Task]:
+        """
+        Get tasks whose status is any of the given statuses in a single query.
+        
+        Args:
+            statuses: Task statuses to match
+            
+        Returns:
+            List[Task]: List of tasks with any of the specified statuses
+        """
+        return self._find_tasks({"status": {"$in": statuses}})
+    
+    def get_task_summaries_by_statuses(self, statuses: List[str]) -> List[TaskSummary]:
+        """
+        Get the ID, title and status of tasks whose status is any of the given statuses.
+        
+        Only those fields are fetched, so no partly filled Task is built (or cached).
         
-        for doc in cursor:
-            tasks.append(Task.from_dict(doc))
+        Args:
+            statuses: Task statuses to match
+            
+        Returns:
+            List[TaskSummary]: Summaries of matching tasks, latest first
+        """
+        cursor = self._find_sorted({"status": {"$in": statuses}}, projection=SUMMARY_FIELDS)
+        return [TaskSummary.from_doc(doc) for doc in cursor]
+    
+    def count_tasks_by_statuses(self, statuses: List[str]) -> int:
+        """
+        Count tasks whose status is any of the given statuses without fetching them.
         
-        return tasks
\ No newline at end of file
+        Args:
+            statuses: Task statuses to match
+            
+        Returns:
+            int: Number of matching tasks
+        """
+        return self.collection.count_documents({"status": {"$in": statuses}})
+    
+    def get_tasks_by_filters(self, status: Optional[str] = None, priority: Optional[str] = None,
+                             sort_field: str = "created_at", sort_order: str = "desc") -> List[Task]:
+        """
+        Get tasks matching the given status and/or priority in a single query.
+        
+        Args:
+            status: Task status (ignored if None)
+            priority: Task priority (ignored if None)
+            sort_field: Field to sort by (latest first by default)
+            sort_order: 'asc' or 'desc'
+            
+        Returns:
+            List[Task]: List of tasks matching all provided filters
+        """
+        return self._find_tasks(self._build_filters(status, priority), sort_field, sort_order)
+    
+    def iter_tasks(self, status: Optional[str] = None, priority: Optional[str] = None,
+                   sort_field: str = "created_at", sort_order: str = "desc") -> Iterator[Task]:
+        """
+        Stream filtered, sorted tasks as they arrive instead of building a list first.
+        
+        Args:
+            status: Task status (ignored if None)
+            priority: Task priority (ignored if None)
+            sort_field: Field to sort by (latest first by default)
+            sort_order: 'asc' or 'desc'
+            
+        Returns:
+            Iterator[Task]: Tasks matching all provided filters, in sort order
+        """
+        return self._iter_find(self._build_filters(status, priority), sort_field, sort_order)
+    
+    @staticmethod
+    def _build_filters(status: Optional[str], priority: Optional[str]) -> dict:
+        """Build the MongoDB filter document for the optional status/priority filters."""
+        query = {}
+        if status:
+            query["status"] = status
+        if priority:
+            query["priority"] = priority
+        return query
\ No newline at end of file
@@ -1,12 +1,49 @@
 """Command Line Interface for Task Manager."""
 
-from datetime import datetime
-from dateutil.parser import parse as parse_date
+import argparse
+import logging
+from itertools import chain
+from bson import ObjectId
 from app.api.task_service import TaskService
+from app.models.task import canonicalize_date
 from app.database.connection import DatabaseConnection
 from app.logger import default_logger as logger
 import config
 
+# Shown after every command; built once instead of per loop iteration
+_HELP_REMINDER = "\n\nType 'help' for available commands or 'exit' to quit."
+
+# Case-insensitive lookups from user input to the canonical option
+_STATUS_LOOKUP = {status.lower(): status for status in config.STATUS_OPTIONS}
+_PRIORITY_LOOKUP = {priority.lower(): priority for priority in config.PRIORITY_LEVELS}
+_SORT_FIELDS = ('title', 'priority', 'status', 'created_at', 'due_date')
+
+
+def _split_pair(value: str) -> tuple:
+    """Split a 'key:value' list argument; value is None when no ':' was given."""
+    key, sep, val = value.partition(':')
+    return key.lower(), (val if sep else None)
+
+
+def _undated_last(tasks):
+    """Yield dated tasks as they arrive and hold back undated ones until the end."""
+    # MongoDB orders missing due dates first when ascending; they are always listed last
+    undated = []
+    for task in tasks:
+        if task.due_date:
+            yield task
+        else:
+            undated.append(task)
+    yield from undated
+
+
+def _build_list_parser() -> argparse.ArgumentParser:
+    """Build the parser for the 'list' command arguments."""
+    parser = argparse.ArgumentParser(prog='list', add_help=False, allow_abbrev=False, exit_on_error=False)
+    parser.add_argument('--filter', action='append', default=[], type=_split_pair)
+    parser.add_argument('--sort', type=_split_pair)
+    return parser
+
 
 class TaskCLI:
     """Command Line Interface for managing tasks."""
@@ -16,6 +53,17 @@ class TaskCLI:
         self.db_connection = DatabaseConnection()
         self.task_service = None
         self.running = False
+        self._list_parser = _build_list_parser()
+        # Command name -> handler, each called with the remaining command words
+        self._dispatch = {
+            "help": lambda args: self.show_help(),
+            "add": lambda args: self.add_task(),
+            "list": self.list_tasks,
+            "mark_complete": lambda args: self.mark_task_complete(),
+            "update": lambda args: self.update_task(),
+            "delete": lambda args: self.delete_task(),
+            "exit": lambda args: self._exit(),
+        }
     
     def start(self):
         """Start the CLI application."""
@@ -27,7 +75,7 @@ class TaskCLI:
             print("Failed to start application. Please ensure MongoDB is running.")
             return
         
-        self.task_service = TaskService(self.db_connection)
+        self.task_service = TaskService(self.db_connection.get_collection())
         self.running = True
         
         logger.info("Type 'help' for available commands or 'exit' to quit.")
@@ -40,7 +88,7 @@ class TaskCLI:
                 logger.info("\n\nGoodbye!")
                 break
             except Exception as e:
-                logger.error(f"An error occurred: {e}")
+                logger.error("An error occurred: %s", e)
         
         self.db_connection.close()
     
@@ -50,29 +98,22 @@ class TaskCLI:
         command_parts = command.split()
         base_command = command_parts[0] if command_parts else ""
         
-        if base_command == "help":
-            self.show_help()
-        elif base_command == "add":
-            self.add_task()
-        elif base_command == "list":
-            # Parse list command arguments
-            args = command_parts[1:] if len(command_parts) > 1 else []
-            self.list_tasks(args)
-        elif base_command =="mark_complete":
-            self.mark_task_complete()
-        elif base_command == "update":
-            self.update_task()
-        elif base_command == "delete":
-            self.delete_task()
-        elif base_command == "exit":
-            self.running = False
-            logger.info("Goodbye!")
+        handler = self._dispatch.get(base_command)
+        if handler:
+            handler(command_parts[1:])
         elif command == "":
             pass  # Ignore empty input
         else:
-            logger.error(f"Unknown command: '{command}'. Type 'help' for available commands.")
+            logger.error("Unknown command: '%s'. Type 'help' for available commands.", command)
         
-        logger.info("\n\nType 'help' for available commands or 'exit' to quit.")
+        # Skip formatting entirely when INFO output is turned off (e.g. scripted use)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_HELP_REMINDER)
+    
+    def _exit(self):
+        """Stop the command loop."""
+        self.running = False
+        logger.info("Goodbye!")
     
     def show_help(self):
         """Display help information."""
@@ -110,15 +151,14 @@ class TaskCLI:
             due_date = None
             if due_date_str:
                 try:
-                    # Validate date format
-                    parse_date(due_date_str)
-                    due_date = due_date_str
-                except:
+                    # Same check the Task model applies, stored in canonical YYYY-MM-DD form
+                    due_date = canonicalize_date(due_date_str)
+                except Exception:
                     logger.warning("Invalid date format. Due date not set.")
             
-            logger.info(f"Priority options: {', '.join(config.PRIORITY_LEVELS)}")
-            priority = input("Enter priority (High/Medium/Low): ").strip().title()
-            if priority not in config.PRIORITY_LEVELS:
+            logger.info("Priority options: %s", ', '.join(config.PRIORITY_LEVELS))
+            priority = _PRIORITY_LOOKUP.get(input("Enter priority (High/Medium/Low): ").strip().lower())
+            if priority is None:
                 priority = "Low"
                 logger.warning("Invalid priority. Set to 'Low'.")
             
@@ -130,12 +170,12 @@ class TaskCLI:
                 priority=priority
             )
             if(task.title):
-                logger.info(f"Task created successfully! ID: {task.task_id}")
+                logger.info("Task created successfully! ID: %s", task.task_id)
             else:
                 logger.warning("Failed to create task")
             
         except Exception as e:
-            logger.error(f"Failed to create task: {e}")
+            logger.error("Failed to create task: %s", e)
     
     def list_tasks(self, args=None):
         """List all tasks with optional filtering and sorting via arguments or interactive mode."""
@@ -151,42 +191,39 @@ class TaskCLI:
             
             # Parse command line arguments if provided
             if args:
-                i = 0
-                while i < len(args):
-                    if args[i] == '--filter' and i + 1 < len(args):
-                        filter_arg = args[i + 1]
-                        if ':' in filter_arg:
-                            filter_type, filter_value = filter_arg.split(':', 1)
-                            if filter_type.lower() == 'status':
-                                if filter_value.title() in config.STATUS_OPTIONS:
-                                    status_filter = filter_value.title()
-                                else:
-                                    logger.warning(f"Invalid status '{filter_value}'. Available: {', '.join(config.STATUS_OPTIONS)}")
-                            elif filter_type.lower() == 'priority':
-                                if filter_value.title() in config.PRIORITY_LEVELS:
-                                    priority_filter = filter_value.title()
-                                else:
-                                    logger.warning(f"Invalid priority '{filter_value}'. Available: {', '.join(config.PRIORITY_LEVELS)}")
-                        i += 2
-                    elif args[i] == '--sort' and i + 1 < len(args):
-                        sort_arg = args[i + 1]
-                        if ':' in sort_arg:
-                            field, order = sort_arg.split(':', 1)
-                            available_fields = ['title', 'priority', 'status', 'created_at', 'due_date']
-                            if field.lower() in available_fields:
-                                sort_field = field.lower()
-                                sort_order = order.lower() if order.lower() in ['asc', 'desc'] else 'desc'
-                            else:
-                                logger.warning(f"Invalid sort field '{field}'. Available: {', '.join(available_fields)}")
+                try:
+                    options, unknown = self._list_parser.parse_known_args(args)
+                except argparse.ArgumentError as e:
+                    logger.warning("Invalid list arguments: %s", e)
+                    return
+                
+                for arg in unknown:
+                    logger.warning("Unknown argument: %s", arg)
+                
+                for filter_type, filter_value in options.filter:
+                    if filter_value is None:
+                        continue
+                    if filter_type == 'status':
+                        status = _STATUS_LOOKUP.get(filter_value.lower())
+                        if status is None:
+                            logger.warning("Invalid status '%s'. Available: %s", filter_value, ', '.join(config.STATUS_OPTIONS))
                         else:
-                            # Just field provided, use default desc order
-                            available_fields = ['title', 'priority', 'status', 'created_at', 'due_date']
-                            if sort_arg.lower() in available_fields:
-                                sort_field = sort_arg.lower()
-                        i += 2
-                    else:
-                        logger.warning(f"Unknown argument: {args[i]}")
-                        i += 1
+                            status_filter = status
+                    elif filter_type == 'priority':
+                        priority = _PRIORITY_LOOKUP.get(filter_value.lower())
+                        if priority is None:
+                            logger.warning("Invalid priority '%s'. Available: %s", filter_value, ', '.join(config.PRIORITY_LEVELS))
+                        else:
+                            priority_filter = priority
+                
+                if options.sort:
+                    field, order = options.sort
+                    if field in _SORT_FIELDS:
+                        sort_field = field
+                        # Just field provided, use default desc order
+                        sort_order = order.lower() if order and order.lower() in ['asc', 'desc'] else 'desc'
+                    elif order is not None:
+                        logger.warning("Invalid sort field '%s'. Available: %s", field, ', '.join(_SORT_FIELDS))
             else:
                 # Interactive mode - ask for filtering and sorting options
                 print("\nFiltering and Sorting Options:")
@@ -195,10 +232,8 @@ class TaskCLI:
                 
                 if filter_status:
                     print(f"Available statuses: {', '.join(config.STATUS_OPTIONS)}")
-                    status_input = input("Enter status: ").strip().title()
-                    if status_input in config.STATUS_OPTIONS:
-                        status_filter = status_input
-                    else:
+                    status_filter = _STATUS_LOOKUP.get(input("Enter status: ").strip().lower())
+                    if status_filter is None:
                         logger.warning("Invalid status. No status filter applied.")
                 
                 print("Filter by priority? (y/N):", end=" ")
@@ -206,10 +241,8 @@ class TaskCLI:
                 
                 if filter_priority:
                     print(f"Available priorities: {', '.join(config.PRIORITY_LEVELS)}")
-                    priority_input = input("Enter priority: ").strip().title()
-                    if priority_input in config.PRIORITY_LEVELS:
-                        priority_filter = priority_input
-                    else:
+                    priority_filter = _PRIORITY_LOOKUP.get(input("Enter priority: ").strip().lower())
+                    if priority_filter is None:
                         logger.warning("Invalid priority. No priority filter applied.")
                 
                 # Sorting options
@@ -217,10 +250,9 @@ class TaskCLI:
                 sort_tasks = input().strip().lower() == 'y'
                 
                 if sort_tasks:
-                    available_fields = ['title', 'priority', 'status', 'created_at', 'due_date']
-                    print(f"Available sort fields: {', '.join(available_fields)}")
+                    print(f"Available sort fields: {', '.join(_SORT_FIELDS)}")
                     sort_field_input = input("Enter sort field: ").strip().lower()
-                    if sort_field_input in available_fields:
+                    if sort_field_input in _SORT_FIELDS:
                         sort_field = sort_field_input
                         print("Sort order: (1) Ascending (2) Descending")
                         order_choice = input("Enter choice (1/2): ").strip()
@@ -228,46 +260,17 @@ class TaskCLI:
                     else:
                         logger.warning("Invalid sort field. Default sorting will be used.")
             
-            # Get tasks based on filters
-            if status_filter and priority_filter:
-                # Get all tasks and filter manually for both conditions
-                tasks = self.task_service.get_all_tasks()
-                tasks = [task for task in tasks if task.status == status_filter and task.priority == priority_filter]
-            elif status_filter:
-                tasks = self.task_service.get_tasks_by_status(status_filter)
-            elif priority_filter:
-                tasks = self.task_service.get_tasks_by_priority(priority_filter)
-            else:
-                tasks = self.task_service.get_all_tasks()
+            # Stream tasks based on filters, sorted by MongoDB (latest first by default)
+            tasks = self.task_service.iter_tasks(status=status_filter, priority=priority_filter,
+                                                 sort_field=sort_field or 'created_at',
+                                                 sort_order=sort_order if sort_field else 'desc')
             
-            # Apply sorting if requested
-            if sort_field and tasks:
-                reverse_order = (sort_order == 'desc')
-                
-                if sort_field == 'title':
-                    tasks.sort(key=lambda x: x.title.lower(), reverse=reverse_order)
-                elif sort_field == 'priority':
-                    # Custom priority sorting: High > Medium > Low
-                    priority_order = {'High': 3, 'Medium': 2, 'Low': 1}
-                    tasks.sort(key=lambda x: priority_order.get(x.priority, 0), reverse=reverse_order)
-                elif sort_field == 'status':
-                    tasks.sort(key=lambda x: x.status, reverse=reverse_order)
-                elif sort_field == 'created_at':
-                    tasks.sort(key=lambda x: x.created_at, reverse=reverse_order)
-                elif sort_field == 'due_date':
-                    # Handle None due dates by putting them at the end
-                    def due_date_key(task):
-                        if task.due_date is None:
-                            return datetime.max if not reverse_order else datetime.min
-                        try:
-                            return parse_date(task.due_date)
-                        except:
-                            return datetime.max if not reverse_order else datetime.min
-                    
-                    tasks.sort(key=due_date_key, reverse=reverse_order)
+            if sort_field == 'due_date':
+                tasks = _undated_last(tasks)
             
             # Display results
-            if not tasks:
+            first_task = next(tasks, None)
+            if first_task is None:
                 logger.warning("No tasks found matching the criteria.")
                 return
             
@@ -286,13 +289,15 @@ class TaskCLI:
             
             print("-" * 50)
             
-            for i, task in enumerate(tasks, 1):
-                print(f"{i}. {task.display()}")
+            # Print each task as it arrives instead of waiting for the whole result
+            for total, task in enumerate(chain((first_task,), tasks), 1):
+                print(f"{total}. {task.display()}")
             
-            logger.info(f"\nTotal tasks displayed: {len(tasks)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\nTotal tasks displayed: %d", total)
             
         except Exception as e:
-            logger.error(f"Failed to retrieve tasks: {e}")
+            logger.error("Failed to retrieve tasks: %s", e)
     
     def mark_task_complete(self):
         """List all tasks."""
@@ -300,7 +305,14 @@ class TaskCLI:
         print("=" * 30)
         
         try:
-            tasks = self.task_service.get_tasks_by_status('In Progress')
+            #probe with a count first so nothing is downloaded when there is nothing to complete
+            if not self.task_service.count_tasks_by_statuses(['In Progress', 'Pending']):
+                logger.info("No incomplete tasks available to mark as complete.")
+                return
+            
+            incomplete = self.task_service.get_task_summaries_by_statuses(['In Progress', 'Pending'])
+            tasks = [task for task in incomplete if task.status == 'In Progress']
+            tasks_incomplete = [task for task in incomplete if task.status == 'Pending']
             check_tasks = 0
             if(tasks):
                 logger.info("All In Progress tasks.")
@@ -309,7 +321,6 @@ class TaskCLI:
                 check_tasks += 1
             else:
                 logger.info("No In Progress tasks")
-            tasks_incomplete = self.task_service.get_tasks_by_status('Pending')
 
             if(tasks_incomplete):
                 logger.info("All in Pending tasks")
@@ -320,30 +331,39 @@ class TaskCLI:
                 logger.info("No In Pending tasks")
             
             if check_tasks >0:
-                task_id = input(f"Task ID: ").strip()
+                task_id_input = input("Task ID(s), separated by spaces or commas: ").strip()
+                task_ids = task_id_input.replace(',', ' ').split()
+                #several IDs are completed in one bulk update
+                if len(task_ids) > 1:
+                    valid_ids = [task_id for task_id in task_ids if ObjectId.is_valid(task_id)]
+                    invalid_ids = [task_id for task_id in task_ids if not ObjectId.is_valid(task_id)]
+                    if invalid_ids:
+                        logger.warning("Invalid task ID(s) skipped: %s", ', '.join(invalid_ids))
+                    completed_count = self.task_service.mark_tasks_completed(valid_ids)
+                    logger.info("Successfully completed %d of %d tasks", completed_count, len(task_ids))
+                    if completed_count < len(valid_ids):
+                        logger.warning("%d valid ID(s) were not found or already completed.",
+                                       len(valid_ids) - completed_count)
+                    return
                 #validate input
-                if task_id:
-                    validated_task = self.task_service.get_task_by_id(task_id)
-                    if not validated_task:
-                        logger.warning(f"{task_id} -  not found.")
+                if task_ids:
+                    task_id = task_ids[0]
+                    #validate and execute in one call
+                    completed, task = self.task_service.mark_task_completed(task_id)
+                    if not task:
+                        logger.warning("%s -  not found.", task_id)
                         return
-                    else:
-                        #make sure that the status of the selected task is incomplete to provide appropriate message
-                        if validated_task.status == 'Completed':
-                            logger.warning(f"{validated_task.task_id} - {validated_task.title} is already completed!")
-                            return
-                        else:
-                            #execute command
-                            if self.task_service.mark_task_completed(validated_task.task_id):
-                                logger.info(f"Successfully completed task {validated_task.task_id}-{validated_task.title}")
-                            else:
-                                logger.error(f"Failed to complete task {validated_task.task_id}")
+                    #make sure that the status of the selected task was incomplete to provide appropriate message
+                    if not completed:
+                        logger.warning("%s - %s is already completed!", task.task_id, task.title)
+                        return
+                    logger.info("Successfully completed task %s-%s", task.task_id, task.title)
             else:
                 logger.info("No incomplete tasks available to mark as complete.")
 
             
         except Exception as e:
-            logger.error(f"Failed to retrieve tasks: {e}")
+            logger.error("Failed to retrieve tasks: %s", e)
     def update_task(self):
         """Update an existing task."""
         print("\nUPDATE TASK")
@@ -361,7 +381,7 @@ class TaskCLI:
                 logger.warning("Task not found!")
                 return
             
-            logger.info(f"\nCurrent task details:")
+            logger.info("\nCurrent task details:")
             logger.info(existing_task.display())
             
             print("\nEnter new values (press Enter to keep current value):")
@@ -380,23 +400,24 @@ class TaskCLI:
             new_due_date = input(f"Due date [{existing_task.due_date or 'Not set'}]: ").strip()
             if new_due_date:
                 try:
-                    parse_date(new_due_date)
-                    updates["due_date"] = new_due_date
-                except:
+                    updates["due_date"] = canonicalize_date(new_due_date)
+                except Exception:
                     logger.warning("Invalid date format. Due date not updated.")
             
-            logger.info(f"Priority options: {', '.join(config.PRIORITY_LEVELS)}")
-            new_priority = input(f"Priority [{existing_task.priority}]: ").strip().title()
-            if new_priority and new_priority in config.PRIORITY_LEVELS:
+            logger.info("Priority options: %s", ', '.join(config.PRIORITY_LEVELS))
+            priority_input = input(f"Priority [{existing_task.priority}]: ").strip()
+            new_priority = _PRIORITY_LOOKUP.get(priority_input.lower())
+            if new_priority:
                 updates["priority"] = new_priority
-            elif new_priority:
+            elif priority_input:
                 logger.warning("Invalid priority. Not updated.")
             
-            logger.info(f"Status options: {', '.join(config.STATUS_OPTIONS)}")
-            new_status = input(f"Status [{existing_task.status}]: ").strip().title()
-            if new_status and new_status in config.STATUS_OPTIONS:
+            logger.info("Status options: %s", ', '.join(config.STATUS_OPTIONS))
+            status_input = input(f"Status [{existing_task.status}]: ").strip()
+            new_status = _STATUS_LOOKUP.get(status_input.lower())
+            if new_status:
                 updates["status"] = new_status
-            elif new_status:
+            elif status_input:
                 logger.warning("Invalid status. Not updated.")
             
             if not updates:
@@ -410,7 +431,7 @@ class TaskCLI:
                 logger.error("Failed to update task.")
                 
         except Exception as e:
-            logger.error(f"Failed to update task: {e}")
+            logger.error("Failed to update task: %s", e)
     
     def delete_task(self):
         """Delete a task."""
@@ -443,4 +464,4 @@ class TaskCLI:
                 logger.warning("Failed to delete task.")
                 
         except Exception as e:
-            logger.error(f"Failed to delete task: {e}")
\ No newline at end of file
+            logger.error("Failed to delete task: %s", e)
\ No newline at end of file
@@ -1,10 +1,42 @@
 """Database connection handler for MongoDB."""
 
-from pymongo import MongoClient
+import atexit
+from typing import Optional
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import IndexModel, MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
 from app.logger import default_logger as logger
-import config
+from config import MONGO_CONFIG
+
+# Case-insensitive collation used for title sorting (and its index)
+TITLE_COLLATION = {"locale": "en", "strength": 2}
+
+# Indexes backing every filter/sort the task service issues; sorts break ties on
+# created_at in the sort's own direction, so each index serves asc and desc alike
+TASK_INDEXES = [
+    IndexModel([("created_at", 1)]),
+    IndexModel([("status", 1), ("created_at", 1)]),
+    IndexModel([("priority", 1), ("created_at", 1)]),
+    IndexModel([("status", 1), ("priority", 1), ("created_at", 1)]),
+    IndexModel([("title", 1), ("created_at", 1)], collation=TITLE_COLLATION),
+    IndexModel([("due_date", 1), ("created_at", 1)]),
+    IndexModel([("priority_rank", 1), ("created_at", 1)]),
+]
+
+# Shared client for the whole process; MongoClient pools connections internally
+_CLIENT: Optional[MongoClient] = None
+
+
+def _get_client() -> MongoClient:
+    """Create the shared MongoClient on first use and close it at interpreter exit."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = MongoClient(MONGO_CONFIG.uri, maxPoolSize=MONGO_CONFIG.max_pool_size,
+                              appname=MONGO_CONFIG.app_name)
+        atexit.register(_CLIENT.close)
+    return _CLIENT
 
 
 class DatabaseConnection:
@@ -16,19 +48,28 @@ class DatabaseConnection:
         self._database: Database = None
         self._collection: Collection = None
     
-    def connect(self) -> bool:
+    def connect(self, verify: bool = False) -> bool:
         """
         Establish connection to MongoDB.
         
+        Args:
+            verify: Ping the server before returning (costs an extra round-trip)
+        
         Returns:
             bool: True if connection successful, False otherwise
         """
         try:
-            self._client = MongoClient(config.MONGODB_URI)
-            # Test connection
-            self._client.admin.command('ping')
-            self._database = self._client[config.DATABASE_NAME]
-            self._collection = self._database[config.COLLECTION_NAME]
+            self._client = _get_client()
+            if verify:
+                self._client.admin.command('ping')
+            self._database = self._client[MONGO_CONFIG.db]
+            # Documents stay as raw BSON and are only decoded when fields are read
+            self._collection = self._database.get_collection(
+                MONGO_CONFIG.coll,
+                codec_options=CodecOptions(document_class=RawBSONDocument)
+            )
+            # Idempotent, so safe on every startup; also the first round-trip to the server
+            self._collection.create_indexes(TASK_INDEXES)
             logger.info("Connected to MongoDB successfully")
             return True
         except Exception as e:
@@ -42,10 +83,10 @@ class DatabaseConnection:
         return self._collection
     
     def close(self):
-        """Close database connection."""
-        if self._client:
-            self._client.close()
-            logger.info("Database connection closed")
+        """Release this handle; the shared client is closed at interpreter exit."""
+        self._client = None
+        self._database = None
+        self._collection = None
     
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,44 @@
+"""One-off data migrations for the tasks collection.
+
+Run from the project root with `python -m app.database.migrations`.
+"""
+
+from pymongo.collection import Collection
+from app.database.connection import DatabaseConnection
+from app.logger import default_logger as logger
+from app.models.task import PRIORITY_RANK
+
+
+def backfill_priority_rank(collection: Collection) -> int:
+    """
+    Store priority_rank on tasks written before it existed, so priority sorts rank them too.
+    
+    Args:
+        collection: MongoDB tasks collection
+    
+    Returns:
+        int: Number of tasks updated
+    """
+    updated = 0
+    for priority, rank in PRIORITY_RANK.items():
+        # Equality on null also matches a missing field, so the priority_rank index is used
+        result = collection.update_many(
+            {"priority_rank": None, "priority": priority},
+            {"$set": {"priority_rank": rank}}
+        )
+        updated += result.modified_count
+    return updated
+
+
+def main():
+    """Apply every migration against the configured database."""
+    db_connection = DatabaseConnection()
+    if not db_connection.connect():
+        return
+    
+    updated = backfill_priority_rank(db_connection.get_collection())
+    logger.info("Stored priority_rank on %d task(s)", updated)
+
+
+if __name__ == "__main__":
+    main()
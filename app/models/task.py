@@ -1,16 +1,171 @@
 """Task model definition."""
 
-from datetime import datetime
-from typing import Optional
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional
 from bson import ObjectId
+from config import PRIORITY_LEVELS, STATUS_OPTIONS, VALID_PRIORITIES, VALID_STATUSES
+
+# Numeric rank stored alongside priority so MongoDB can sort High > Medium > Low
+PRIORITY_RANK = {"High": 3, "Medium": 2, "Low": 1}
+
+# Structural check for the stored YYYY-MM-DD due date format
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+# CLI display layout, built once instead of per display() call
+_DISPLAY_TMPL = (
+    "\nID: {task_id}"
+    "\nTitle: {title}"
+    "\nDescription: {description}"
+    "\nDue Date: {due_date}"
+    "\nPriority: {priority}"
+    "\nStatus: {status}"
+    "\nCreated: {created}"
+    "\n" + "-" * 50
+)
+_CREATED_FMT = '%Y-%m-%d %H:%M:%S'
+_STR_FMT = "Task(id=%s, title='%s', status='%s')"
+
+# Common spellings mapped straight to the canonical value, skipping strip()/title()
+_PRIORITY_CANON = {variant: value for value in PRIORITY_LEVELS
+                   for variant in (value, value.lower(), value.upper())}
+_STATUS_CANON = {variant: value for value in STATUS_OPTIONS
+                 for variant in (value, value.lower(), value.upper())}
+
+
+def _validate_title(value: str) -> str:
+    """Validate and normalize a task title."""
+    if not isinstance(value, str):
+        raise TypeError("Title must be a string")
+    if not value.strip():
+        raise ValueError("Title cannot be empty")
+    if len(value.strip()) > 200:
+        raise ValueError("Title cannot exceed 200 characters")
+    return value.strip()
+
+
+def _validate_description(value: str) -> str:
+    """Validate a task description."""
+    if not isinstance(value, str):
+        raise TypeError("Description must be a string")
+    if len(value) > 1000:
+        raise ValueError("Description cannot exceed 1000 characters")
+    return value
+
+
+@lru_cache(maxsize=256)
+def canonicalize_date(value: str) -> str:
+    """Normalize a date string to YYYY-MM-DD, memoized since many tasks share due dates."""
+    match = _DATE_RE.fullmatch(value)
+    if match:
+        # Fast path: already in the stored format; date() rejects out-of-range days/months
+        year, month, day = match.groups()
+        date(int(year), int(month), int(day))
+        return value
+    
+    # dateutil is slow to import, so only load it for free-form dates
+    from dateutil.parser import parse as parse_date
+    return parse_date(value).strftime('%Y-%m-%d')
+
+
+def _validate_due_date(value: Optional[str]) -> Optional[str]:
+    """Validate a due date and normalize it to YYYY-MM-DD."""
+    if value is None or value == "":
+        return None
+    
+    if not isinstance(value, str):
+        raise TypeError("Due date must be a string or None")
+    
+    try:
+        # Validate date format and store in consistent format
+        return canonicalize_date(value)
+    except Exception:
+        raise ValueError("Due date must be in valid date format (e.g., YYYY-MM-DD)")
+
+
+def _validate_priority(value: str) -> str:
+    """Validate and normalize a priority level."""
+    if not isinstance(value, str):
+        raise TypeError("Priority must be a string")
+    
+    canonical = _PRIORITY_CANON.get(value)
+    if canonical is None:
+        canonical = value.strip().title()
+        if canonical not in VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of: {', '.join(PRIORITY_LEVELS)}")
+    
+    return canonical
+
+
+def _validate_status(value: str) -> str:
+    """Validate and normalize a task status."""
+    if not isinstance(value, str):
+        raise TypeError("Status must be a string")
+    
+    canonical = _STATUS_CANON.get(value)
+    if canonical is None:
+        canonical = value.strip().title()
+        if canonical not in VALID_STATUSES:
+            raise ValueError(f"Status must be one of: {', '.join(STATUS_OPTIONS)}")
+    
+    return canonical
+
+
+# Field name -> validator, used by Task.update() and validate_fields() to re-validate only changed fields
+_VALIDATORS = {
+    "title": _validate_title,
+    "description": _validate_description,
+    "due_date": _validate_due_date,
+    "priority": _validate_priority,
+    "status": _validate_status,
+}
+
+
+def _validate_task(title, description, due_date, priority, status) -> tuple:
+    """
+    Validate every user-editable field at once.
+    
+    Returns:
+        tuple: Normalized (title, description, due_date, priority, status)
+    """
+    return (
+        _validate_title(title),
+        _validate_description(description),
+        _validate_due_date(due_date),
+        _validate_priority(priority),
+        _validate_status(status),
+    )
+
+
+def validate_fields(updates: dict) -> dict:
+    """
+    Validate a partial set of task fields, e.g. before writing them to MongoDB.
+    
+    Invalid values raise TypeError or ValueError, as they would on a Task.
+    
+    Args:
+        updates: New values for any of title, description, due_date, priority or status
+        
+    Returns:
+        dict: The same fields with normalized values
+    """
+    validated = {}
+    for key, value in updates.items():
+        validator = _VALIDATORS.get(key)
+        if validator is None:
+            raise ValueError(f"Task has no editable field '{key}'")
+        validated[key] = validator(value)
+    return validated
 
 
 class Task:
-    """Task model representing a task entity with proper encapsulation."""
+    """Task model representing a task entity, validated once on construction."""
     
-    # Class constants for validation
-    VALID_PRIORITIES = ["High", "Medium", "Low"]
-    VALID_STATUSES = ["Pending", "In Progress", "Completed"]
+    # Fields are plain slots so reads skip descriptor dispatch. Change them only through
+    # update(): assigning a field directly leaves priority_rank and display() stale
+    __slots__ = ("_task_id", "_created_at", "_hash", "_display", "_created_at_str", "title",
+                 "description", "due_date", "priority", "priority_rank", "status")
     
     def __init__(self, title: str, description: str = "", due_date: Optional[str] = None,
                  priority: str = "Medium", status: str = "Pending",
@@ -24,24 +179,28 @@ class Task:
             due_date: Due date in YYYY-MM-DD format
             priority: Priority level (High, Medium, Low)
             status: Task status (Pending, In Progress, Completed)
-            task_id: MongoDB ObjectId (auto-generated if None)
+            task_id: MongoDB ObjectId (generated on first use if None)
             created_at: Creation timestamp (auto-generated if None)
         """
         # Private attributes (convention using underscore)
-        self._task_id = task_id or ObjectId()
+        # ObjectId is only generated when the id is first needed (e.g. to_dict())
+        self._task_id = task_id
         self._created_at = created_at or datetime.now()
+        self._created_at_str = self._created_at.strftime(_CREATED_FMT)
+        self._hash = 0
+        self._display = None
         
-        # Use property setters for validation
-        self.title = title
-        self.description = description
-        self.due_date = due_date
-        self.priority = priority
-        self.status = status
+        # Validate all fields once, then assign directly
+        (self.title, self.description, self.due_date,
+         self.priority, self.status) = _validate_task(title, description, due_date, priority, status)
+        self.priority_rank = PRIORITY_RANK[self.priority]
     
     # Property for task_id (read-only after creation)
     @property
     def task_id(self) -> ObjectId:
-        """Get task ID (read-only)."""
+        """Get task ID (read-only), generating it on first access."""
+        if self._task_id is None:
+            self._task_id = ObjectId()
         return self._task_id
     
     # Property for created_at (read-only)
@@ -50,110 +209,45 @@ class Task:
         """Get creation timestamp (read-only)."""
         return self._created_at
     
-    # Property for title with validation
-    @property
-    def title(self) -> str:
-        """Get task title."""
-        return self._title
-    
-    @title.setter
-    def title(self, value: str):
-        """Set task title with validation."""
-        if not isinstance(value, str):
-            raise TypeError("Title must be a string")
-        if not value.strip():
-            raise ValueError("Title cannot be empty")
-        if len(value.strip()) > 200:
-            raise ValueError("Title cannot exceed 200 characters")
-        self._title = value.strip()
-    
-    # Property for description with validation
-    @property
-    def description(self) -> str:
-        """Get task description."""
-        return self._description
-    
-    @description.setter
-    def description(self, value: str):
-        """Set task description with validation."""
-        if not isinstance(value, str):
-            raise TypeError("Description must be a string")
-        if len(value) > 1000:
-            raise ValueError("Description cannot exceed 1000 characters")
-        self._description = value
-    
-    # Property for due_date with validation
-    @property
-    def due_date(self) -> Optional[str]:
-        """Get due date."""
-        return self._due_date
-    
-    @due_date.setter
-    def due_date(self, value: Optional[str]):
-        """Set due date with validation."""
-        if value is None or value == "":
-            self._due_date = None
-            return
-        
-        if not isinstance(value, str):
-            raise TypeError("Due date must be a string or None")
+    def update(self, **changes):
+        """
+        Change fields, re-validating only the ones given.
         
-        try:
-            # Validate date format
-            parsed_date = parse_date(value)
-            # Store in consistent format
-            self._due_date = parsed_date.strftime('%Y-%m-%d')
-        except Exception:
-            raise ValueError("Due date must be in valid date format (e.g., YYYY-MM-DD)")
-    
-    # Property for priority with validation
-    @property
-    def priority(self) -> str:
-        """Get task priority."""
-        return self._priority
-    
-    @priority.setter
-    def priority(self, value: str):
-        """Set task priority with validation."""
-        if not isinstance(value, str):
-            raise TypeError("Priority must be a string")
+        This is the only supported way to modify a task; it keeps priority_rank and
+        the cached display() text in step with the fields.
         
-        value_title = value.strip().title()
-        if value_title not in self.VALID_PRIORITIES:
-            raise ValueError(f"Priority must be one of: {', '.join(self.VALID_PRIORITIES)}")
+        Args:
+            **changes: New values for title, description, due_date, priority or status
+        """
+        for key, value in changes.items():
+            validator = _VALIDATORS.get(key)
+            if validator is None:
+                raise AttributeError(f"Task has no editable field '{key}'")
+            setattr(self, key, validator(value))
         
-        self._priority = value_title
+        if "priority" in changes:
+            self.priority_rank = PRIORITY_RANK[self.priority]
+        # Cached display text is stale now
+        self._display = None
     
-    # Property for status with validation
-    @property
-    def status(self) -> str:
-        """Get task status."""
-        return self._status
-    
-    @status.setter
-    def status(self, value: str):
-        """Set task status with validation."""
-        if not isinstance(value, str):
-            raise TypeError("Status must be a string")
-        
-        value_title = value.strip().title()
-        if value_title not in self.VALID_STATUSES:
-            raise ValueError(f"Status must be one of: {', '.join(self.VALID_STATUSES)}")
-        
-        self._status = value_title
-        
     def to_dict(self) -> dict:
         """Convert task to dictionary for MongoDB storage."""
         return {
-            "_id": self._task_id,
-            "title": self._title,
-            "description": self._description,
-            "due_date": self._due_date,
-            "priority": self._priority,
-            "status": self._status,
+            "_id": self.task_id,
+            "title": self.title,
+            "description": self.description,
+            "due_date": self.due_date,
+            "priority": self.priority,
+            "priority_rank": self.priority_rank,
+            "status": self.status,
             "created_at": self._created_at
         }
     
+    @classmethod
+    def from_raw(cls, raw) -> "RawTask":
+        """Wrap a raw BSON document; the Task is only built on first attribute access."""
+        return RawTask(raw)
+    
     @classmethod
     def from_dict(cls, data: dict):
         """Create Task instance from dictionary."""
@@ -167,18 +261,145 @@ class Task:
             created_at=data.get("created_at")
         )
     
+    @classmethod
+    def _from_trusted(cls, data: dict):
+        """
+        Create Task instance from a document this application stored, skipping validation.
+        
+        Documents written via to_dict() are already validated and canonical, so fields
+        are assigned directly. Use from_dict() for anything else.
+        """
+        obj = cls.__new__(cls)
+        obj._load_trusted(data)
+        return obj
+    
+    @classmethod
+    def bulk_from_cursor(cls, cursor, batch_size: Optional[int] = None) -> list:
+        """
+        Build trusted Task instances for every document in a MongoDB cursor.
+        
+        Same result as calling _from_trusted() per document, with the method
+        lookups hoisted out of the loop.
+        
+        Args:
+            cursor: PyMongo cursor (or any iterable of stored task documents)
+            batch_size: Documents per getMore; the driver's default when None
+            
+        Returns:
+            list: Task instances in cursor order
+        """
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        
+        new = cls.__new__
+        load = cls._load_trusted
+        tasks = []
+        append = tasks.append
+        for doc in cursor:
+            obj = new(cls)
+            load(obj, doc)
+            append(obj)
+        return tasks
+    
+    def _load_trusted(self, data):
+        """Fill every slot from a stored document without validation, see _from_trusted()."""
+        self._task_id = data["_id"]
+        self._created_at = created_at = data.get("created_at")
+        # Tolerate documents stored without created_at
+        self._created_at_str = created_at.strftime(_CREATED_FMT) if created_at else ""
+        self._hash = 0
+        self._display = None
+        self.title = data["title"]
+        self.description = data.get("description", "")
+        self.due_date = data.get("due_date")
+        self.priority = priority = data.get("priority", "Medium")
+        self.priority_rank = PRIORITY_RANK.get(priority, 0)
+        self.status = data.get("status", "Pending")
+    
+    def __eq__(self, other) -> bool:
+        """Tasks are equal when they share the same ObjectId."""
+        if isinstance(other, RawTask):
+            other = other._decoded()
+        if not isinstance(other, Task):
+            return NotImplemented
+        return self.task_id == other.task_id
+    
+    def __hash__(self) -> int:
+        """Hash by ObjectId, computed once since the id never changes."""
+        h = self._hash
+        if h == 0:
+            h = self._hash = hash(self.task_id)
+        return h
+    
     def __str__(self) -> str:
         """String representation of the task."""
-        return f"Task(id={self.task_id}, title='{self.title}', status='{self.status}')"
+        return _STR_FMT % (self.task_id, self.title, self.status)
     
     def display(self) -> str:
-        """Formatted display string for CLI output."""
-        return f"""
-ID: {self.task_id}
-Title: {self.title}
-Description: {self.description}
-Due Date: {self.due_date or 'Not set'}
-Priority: {self.priority}
-Status: {self.status}
-Created: {self.created_at.strftime('%Y-%m-%d %H:%M:%S')}
-{'-' * 50}"""
\ No newline at end of file
+        """Formatted display string for CLI output, built once and reused until update()."""
+        text = self._display
+        if text is None:
+            text = self._display = _DISPLAY_TMPL.format(
+                task_id=self.task_id,
+                title=self.title,
+                description=self.description,
+                due_date=self.due_date or 'Not set',
+                priority=self.priority,
+                status=self.status,
+                created=self._created_at_str
+            )
+        return text
+
+
+class RawTask:
+    """Read-only Task view over a raw BSON document, decoded lazily."""
+    
+    __slots__ = ("_raw", "_task")
+    
+    def __init__(self, raw):
+        """
+        Initialize the view without decoding anything.
+        
+        Args:
+            raw: RawBSONDocument (or any mapping) as returned by MongoDB
+        """
+        self._raw = raw
+        self._task = None
+    
+    def _decoded(self) -> Task:
+        """Decode the document into a Task on first use."""
+        if self._task is None:
+            self._task = Task._from_trusted(self._raw)
+        return self._task
+    
+    def __getattr__(self, name):
+        """Delegate attribute access to the decoded Task."""
+        # Own slots and dunders are never delegated; when unset (copy, pickle or
+        # __new__ without __init__) delegating them would recurse forever
+        if name in RawTask.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._decoded(), name)
+    
+    def __eq__(self, other) -> bool:
+        """Compare as the underlying task."""
+        return self._decoded() == other
+    
+    def __hash__(self) -> int:
+        """Hash as the underlying task."""
+        return hash(self._decoded())
+    
+    def __str__(self) -> str:
+        """String representation of the underlying task."""
+        return str(self._decoded())
+
+
+class TaskSummary(NamedTuple):
+    """ID, title and status of a task, for listings that need nothing else."""
+    task_id: ObjectId
+    title: str
+    status: str
+    
+    @classmethod
+    def from_doc(cls, doc) -> "TaskSummary":
+        """Build a summary from a stored document projected to SUMMARY_FIELDS."""
+        return cls(doc["_id"], doc["title"], doc.get("status", "Pending"))
\ No newline at end of file
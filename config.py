@@ -1,11 +1,29 @@
 """Configuration settings for the Task Manager application."""
-#should be .env and not pushed in a commit but this works for now
 
-# MongoDB Configuration
-MONGODB_URI = "mongodb://localhost:27017/"
-DATABASE_NAME = "task_manager"
-COLLECTION_NAME = "tasks"
+import os
+from typing import NamedTuple
 
-# Task Configuration
-PRIORITY_LEVELS = ["High", "Medium", "Low"]
-STATUS_OPTIONS = ["Pending", "In Progress", "Completed"]
\ No newline at end of file
+
+class MongoConfig(NamedTuple):
+    """Immutable MongoDB connection settings."""
+    uri: str
+    db: str
+    coll: str
+    max_pool_size: int
+    app_name: str
+
+
+# MongoDB Configuration (override via environment variables instead of editing this file)
+MONGO_CONFIG = MongoConfig(
+    uri=os.environ.get("MONGODB_URI", "mongodb://localhost:27017/"),
+    db=os.environ.get("MONGODB_DATABASE", "task_manager"),
+    coll=os.environ.get("MONGODB_COLLECTION", "tasks"),
+    max_pool_size=int(os.environ.get("MONGODB_MAX_POOL_SIZE", "50")),
+    app_name=os.environ.get("MONGODB_APP_NAME", "taskcli"),
+)
+
+# Task Configuration (tuples keep display order, frozensets give O(1) membership)
+PRIORITY_LEVELS = ("High", "Medium", "Low")
+STATUS_OPTIONS = ("Pending", "In Progress", "Completed")
+VALID_PRIORITIES = frozenset(PRIORITY_LEVELS)
+VALID_STATUSES = frozenset(STATUS_OPTIONS)
\ No newline at end of file